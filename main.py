@@ -15,6 +15,7 @@ import logging
 import random
 import signal
 import sys
+import threading
 import time
 from typing import Tuple
 
@@ -39,24 +40,40 @@ DRY_RUN = False               # if True, only logs actions (no actual mouse/key)
 # -----------------------------------------------------------------------------
 
 
-# graceful shutdown flag
-_running = True
+logger = logging.getLogger(__name__)
+
+# hot-loop log formats, interned once instead of rebuilt per call site
+_TS_FMT = "%Y-%m-%d %H:%M:%S"
+_FMT_MOVE = "  Moved #%d -> (%d,%d) over %.2fs"
+_FMT_DRY = "  DRY RUN -> move #%d to (%d,%d) over %.2fs"
+
+
+# graceful shutdown event; set() wakes any pending wait immediately
+_stop = threading.Event()
 
 
 def _handle_signal(signum, frame):
-    global _running
-    logging.info("Received signal %s, shutting down...", signum)
-    _running = False
+    logger.info("Received signal %s, shutting down...", signum)
+    _stop.set()
+
+
+def _install_signal_handlers():
+    signal.signal(signal.SIGINT, _handle_signal)
+    signal.signal(signal.SIGTERM, _handle_signal)
+    # shut down cleanly when the controlling terminal closes (POSIX only)
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, _handle_signal)
 
 
-signal.signal(signal.SIGINT, _handle_signal)
-signal.signal(signal.SIGTERM, _handle_signal)
+def _randint_fast(lo: int, hi: int, _r=random.random) -> int:
+    # single Mersenne-Twister draw; cheaper than random.randint and
+    # plenty uniform for screen-coordinate-sized ranges
+    return lo + int(_r() * (hi - lo + 1))
 
 
-def random_position(margin: int = MARGIN) -> Tuple[int, int]:
-    w, h = pyautogui.size()
-    x = random.randint(margin, max(margin, w - margin - 1))
-    y = random.randint(margin, max(margin, h - margin - 1))
+def random_position(w: int, h: int, margin: int = MARGIN) -> Tuple[int, int]:
+    x = _randint_fast(margin, max(margin, w - margin - 1))
+    y = _randint_fast(margin, max(margin, h - margin - 1))
     return x, y
 
 
@@ -64,13 +81,13 @@ def safe_press(key: str):
     try:
         pyautogui.press(key)
     except Exception as e:
-        logging.warning("Failed to press '%s': %s", key, e)
+        logger.warning("Failed to press '%s': %s", key, e)
 
 
 def choose_moves_count(min_moves: int, max_moves: int) -> int:
     if min_moves == max_moves:
         return min_moves
-    return random.randint(min_moves, max_moves)
+    return _randint_fast(min_moves, max_moves)
 
 
 def compute_next_wait_seconds(base_min: float, jitter: float) -> float:
@@ -89,63 +106,100 @@ def run_loop(
     key: str,
     dry_run: bool,
 ):
-    logging.info("STARTING: base_interval=%.2f min, jitter=%.2f, moves=%d-%d, per_move_delay=%.2fs, press_each=%s, key=%s, dry_run=%s",
-                 base_interval_min, jitter_pct, min_moves, max_moves, per_move_delay, press_each, key, dry_run)
-    global _running
+    logger.info("STARTING: base_interval=%.2f min, jitter=%.2f, moves=%d-%d, per_move_delay=%.2fs, press_each=%s, key=%s, dry_run=%s",
+                base_interval_min, jitter_pct, min_moves, max_moves, per_move_delay, press_each, key, dry_run)
+    # avoid building timestamps/args for log lines that would be discarded
+    info_enabled = logger.isEnabledFor(logging.INFO)
+    # the screen query is a platform call and far pricier than the RNG;
+    # fetch it once instead of on every move
+    screen_w, screen_h = pyautogui.size()
+    # locals skip the module attribute lookup on every cycle
+    _time = time.time
+    _strftime = time.strftime
+    _localtime = time.localtime
+    _press = pyautogui.press
+
+    # specialize the per-move body once: dry_run/press_each/key never change
+    # mid-run, so the inner loop needn't re-test them on every iteration
+    if dry_run:
+        def do_move(i, x, y, dur):
+            if info_enabled:
+                logger.info(_FMT_DRY, i + 1, x, y, dur)
+                if press_each:
+                    logger.info("    DRY RUN -> would press '%s' after move #%d", key, i + 1)
+    elif press_each:
+        def do_move(i, x, y, dur, _move=pyautogui.moveTo, _press=pyautogui.press):
+            try:
+                _move(x, y, duration=dur)
+                if info_enabled:
+                    logger.info(_FMT_MOVE, i + 1, x, y, dur)
+            except Exception as e:
+                logger.warning("  moveTo failed: %s", e)
+            try:
+                _press(key)
+            except Exception as e:
+                logger.warning("Failed to press '%s': %s", key, e)
+            else:
+                if info_enabled:
+                    logger.info("    Pressed '%s' after move #%d", key, i + 1)
+    else:
+        def do_move(i, x, y, dur, _move=pyautogui.moveTo):
+            try:
+                _move(x, y, duration=dur)
+                if info_enabled:
+                    logger.info(_FMT_MOVE, i + 1, x, y, dur)
+            except Exception as e:
+                logger.warning("  moveTo failed: %s", e)
+
     try:
-        while _running:
+        while not _stop.is_set():
             moves_count = choose_moves_count(min_moves, max_moves)
-            now = time.strftime("%Y-%m-%d %H:%M:%S")
-            logging.info("[%s] Performing %d move(s) this cycle.", now, moves_count)
+            # one wall-clock read per cycle; both cycle log lines derive from it
+            t0 = _time()
+            if info_enabled:
+                now = _strftime(_TS_FMT, _localtime(t0))
+                logger.info("[%s] Performing %d move(s) this cycle.", now, moves_count)
 
             for i in range(moves_count):
-                x, y = random_position()
+                x, y = random_position(screen_w, screen_h)
                 dur = random.uniform(*MOVE_DURATION_RANGE)
-                if dry_run:
-                    logging.info("  DRY RUN -> move #%d to (%d,%d) over %.2fs", i + 1, x, y, dur)
-                else:
-                    try:
-                        pyautogui.moveTo(x, y, duration=dur)
-                        logging.info("  Moved #%d -> (%d,%d) over %.2fs", i + 1, x, y, dur)
-                    except Exception as e:
-                        logging.warning("  moveTo failed: %s", e)
-
-                if press_each:
-                    if dry_run:
-                        logging.info("    DRY RUN -> would press '%s' after move #%d", key, i + 1)
-                    else:
-                        safe_press(key)
-                        logging.info("    Pressed '%s' after move #%d", key, i + 1)
+                do_move(i, x, y, dur)
 
-                # wait between moves if more remain
+                # wait between moves if more remain; wakes immediately on shutdown
                 if i < moves_count - 1:
-                    sleep_left = per_move_delay
-                    # small loop so we can react to shutdown signals during sleep
-                    start_t = time.time()
-                    while _running and (time.time() - start_t) < sleep_left:
-                        time.sleep(0.05)
+                    if _stop.wait(per_move_delay):
+                        break
 
             if not press_each:
                 if dry_run:
-                    logging.info("  DRY RUN -> would press '%s' after sequence", key)
+                    if info_enabled:
+                        logger.info("  DRY RUN -> would press '%s' after sequence", key)
                 else:
-                    safe_press(key)
-                    logging.info("  Pressed '%s' after sequence", key)
+                    try:
+                        _press(key)
+                    except Exception as e:
+                        logger.warning("Failed to press '%s': %s", key, e)
+                    else:
+                        if info_enabled:
+                            logger.info("  Pressed '%s' after sequence", key)
 
             # compute next wait
             wait_seconds = compute_next_wait_seconds(base_interval_min, jitter_pct)
-            next_ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time() + wait_seconds))
-            logging.info("Next cycle at ~%s (in %.2f minutes).", next_ts, wait_seconds / 60.0)
+            if info_enabled:
+                next_ts = _strftime(_TS_FMT, _localtime(t0 + wait_seconds))
+                logger.info("Next cycle at ~%s (in %.2f minutes).", next_ts, wait_seconds / 60.0)
 
-            # sleep until next cycle, but remain responsive to signals
-            start = time.time()
-            while _running and (time.time() - start) < wait_seconds:
-                time.sleep(0.2)
+            # sleep until next cycle, but remain responsive to signals.
+            # Event.wait times out on the monotonic clock, so NTP steps or
+            # DST changes cannot stretch or cut the sleep; wall-clock time
+            # is used for the display timestamps only.
+            if _stop.wait(wait_seconds):
+                break
 
     except Exception as e:
-        logging.exception("Unexpected error: %s", e)
+        logger.exception("Unexpected error: %s", e)
     finally:
-        logging.info("Exited run loop. Bye.")
+        logger.info("Exited run loop. Bye.")
 
 
 def parse_cli_and_override_defaults():
@@ -170,6 +224,8 @@ def main():
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
+    _install_signal_handlers()
+
     args = parse_cli_and_override_defaults()
 
     base_interval = args.minutes if args.minutes is not None else INTERVAL_MIN
@@ -183,16 +239,16 @@ def main():
 
     # validation
     if base_interval <= 0:
-        logging.error("Base interval must be > 0.")
+        logger.error("Base interval must be > 0.")
         sys.exit(1)
     if not (0.0 <= jitter <= 1.0):
-        logging.error("Jitter must be between 0.0 and 1.0.")
+        logger.error("Jitter must be between 0.0 and 1.0.")
         sys.exit(1)
     if min_moves < 1 or max_moves < min_moves:
-        logging.error("Invalid move bounds: ensure 1 <= min_moves <= max_moves.")
+        logger.error("Invalid move bounds: ensure 1 <= min_moves <= max_moves.")
         sys.exit(1)
     if per_move_delay < 0:
-        logging.error("per_move_delay must be >= 0.")
+        logger.error("per_move_delay must be >= 0.")
         sys.exit(1)
 
     run_loop(